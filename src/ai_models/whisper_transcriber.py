@@ -1,63 +1,332 @@
+from __future__ import annotations
+
 import logging
-from pathlib import Path
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List
 
 # External Libraries
-import whisper, whisper.audio
+# torch and faster_whisper are imported where they are used: importing this
+# module should not pay for CUDA/CTranslate2 initialisation until a model loads.
+import numpy as np
+
+# Local Imports
+from src.config import settings
+from src.utils.audio_io import SAMPLE_RATE, load_audio_fast
+
+if TYPE_CHECKING:
+    from faster_whisper import BatchedInferencePipeline
 
 logger = logging.getLogger(__name__)
 
+# Longest span of audio handed to one CPU worker process
+MAX_CPU_SPAN_SECONDS = 30 * 60
+
+# Seconds of speech used to detect the language (one Whisper window)
+LANGUAGE_DETECTION_SECONDS = 30
+
+@lru_cache(maxsize=4)
+def get_whisper_model(model_name: str, device: str, compute_type: str, num_workers: int = 1, cpu_threads: int = 0) -> BatchedInferencePipeline:
+    """
+    Load a Whisper model once per combination of arguments and reuse it.
+
+    Every WhisperTranscriber sharing the same settings gets the same model, so the
+    weights are read from disk and copied to the device only on first use.
+    num_workers is the number of transcriptions CTranslate2 can run concurrently
+    on the one model; cpu_threads is the thread count per transcription on CPU
+    (0 lets CTranslate2 decide).
+    """
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+    logger.info(f"Loading Whisper model: {model_name}")
+    logger.info(f"Using device '{device}' with compute type '{compute_type}'")
+    model_kwargs = {}
+    if device == "cuda" and settings.WHISPER_FLASH_ATTENTION:
+        import torch
+
+        # CTranslate2's fused flash attention needs Ampere (sm 80) or newer
+        if torch.cuda.get_device_capability()[0] >= 8:
+            model_kwargs["flash_attention"] = True
+        else:
+            logger.warning("WHISPER_FLASH_ATTENTION is set but this GPU is older than Ampere; ignoring it")
+    whisper_model = WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        num_workers=num_workers,
+        cpu_threads=cpu_threads,
+        **model_kwargs,
+    )
+    # Batch VAD-cut chunks through the encoder instead of decoding 30s windows one by one
+    return BatchedInferencePipeline(model=whisper_model)
+
+def detect_speech_chunks(audio: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Find the voiced regions of a 16 kHz waveform with Silero VAD.
+
+    Args:
+        audio (np.ndarray): Mono float32 waveform sampled at 16 kHz
+
+    Returns:
+        List[Dict[str, Any]]: Speech chunks of at most 30s with "start"/"end" in samples,
+            in the format the batched pipeline accepts as clip_timestamps
+    """
+    from faster_whisper.vad import VadOptions, get_speech_timestamps, merge_segments
+
+    # Same VAD parameters the batched pipeline uses when it runs VAD itself
+    vad_options = VadOptions(max_speech_duration_s=30, min_silence_duration_ms=160)
+    return merge_segments(get_speech_timestamps(audio, vad_options), vad_options)
+
+def _split_speech_chunks(speech_chunks: List[Dict[str, Any]], num_groups: int) -> List[List[Dict[str, Any]]]:
+    """
+    Split speech chunks into at most num_groups consecutive groups of roughly equal duration.
+
+    Groups only break between speech chunks, so no utterance is cut in half.
+    """
+    first_start = speech_chunks[0]["start"]
+    target = (speech_chunks[-1]["end"] - first_start) / num_groups
+    groups = [[] for _ in range(num_groups)]
+    for chunk in speech_chunks:
+        # Place each chunk by its midpoint so every group spans about `target` samples
+        midpoint = (chunk["start"] + chunk["end"]) / 2
+        groups[min(num_groups - 1, int((midpoint - first_start) // target))].append(chunk)
+    return [group for group in groups if group]
+
+def _cpu_worker_count() -> int:
+    """Number of CPU worker processes that fit without oversubscribing the cores."""
+    return max(1, (os.cpu_count() or 1) // settings.WHISPER_CPU_THREADS_PER_WORKER)
+
+def _transcribe_span(model_name: str, compute_type: str, cpu_threads: int, audio: np.ndarray,
+                     clip_timestamps: List[Dict[str, int]], language: str, batch_size: int,
+                     offset: float) -> List[Dict[str, Any]]:
+    """Transcribe one span of audio in a CPU worker process, shifting timestamps by offset seconds."""
+    model = get_whisper_model(model_name, "cpu", compute_type, 1, cpu_threads)
+    segments, _ = model.transcribe(
+        audio,
+        language=language,
+        beam_size=5,
+        vad_filter=True,
+        clip_timestamps=clip_timestamps,
+        batch_size=batch_size,
+    )
+    return [
+        {"text": segment.text, "start": segment.start + offset, "end": segment.end + offset}
+        for segment in segments
+    ]
+
 class WhisperTranscriber:
-    def __init__(self, model_path: str = "base"): # model_path can be size like "base", "small", etc.
+    __slots__ = ("model_name", "batch_size", "num_workers", "model", "device", "compute_type")
+
+    def __init__(self, model_path: str = "base", batch_size: int = settings.WHISPER_BATCH_SIZE, num_workers: int = 1): # model_path can be size like "base", "small", etc.
         self.model_name = model_path
+        self.batch_size = batch_size
+        self.num_workers = num_workers
         self.model = None
         self._load_model()
 
+    @classmethod
+    def preload(cls, model_path: str = "base", num_workers: int = 1, warmup: bool = True):
+        """
+        Load the model into the shared cache ahead of the first transcription.
+
+        With warmup, a second of silence is run through the model so device
+        initialisation and kernel selection happen here instead of on the first
+        real request. The encoder always sees a padded 30s window, so this
+        exercises the same shapes as real audio.
+        """
+        from src.utils.device_utils import get_device_settings
+
+        device, compute_type = get_device_settings(settings.WHISPER_COMPUTE_TYPE)
+        model = get_whisper_model(model_path, device, compute_type, num_workers)
+        if warmup:
+            logger.info("Warming up Whisper model...")
+            segments, _ = model.transcribe(
+                np.zeros(SAMPLE_RATE, dtype=np.float32), language="en", vad_filter=False
+            )
+            # segments is lazy; consume it so the decode actually runs
+            for _ in segments:
+                pass
+
     def _load_model(self):
+        from src.utils.device_utils import get_device_settings
+
         try:
-            logger.info(f"Loading Whisper model: {self.model_name}")
-            self.model = whisper.load_model(self.model_name)
+            self.device, self.compute_type = get_device_settings(settings.WHISPER_COMPUTE_TYPE)
+            self.model = get_whisper_model(self.model_name, self.device, self.compute_type, self.num_workers)
             logger.info("Whisper model loaded successfully.")
         except Exception as e:
             logger.error(f"Failed to load Whisper model '{self.model_name}': {e}")
             raise
 
+    def transcribe_stream(self, audio_path: str, language: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Transcribe an audio file, yielding segments as soon as they are decoded.
+
+        Lets consumers (e.g. a summarizer working on a rolling window) start on
+        the first segments while the rest of the audio is still being transcribed.
+
+        Args:
+            audio_path (str): Path to the audio file
+            language (str, optional): Language code, e.g. "en". When omitted, the
+                configured default is used, or it is detected once if AUTO_DETECT_LANGUAGE is set.
+
+        Yields:
+            Dict[str, Any]: Segment with "text", "start" and "end" (seconds)
+        """
+        if not self.model:
+            raise RuntimeError("Whisper model is not loaded. Cannot transcribe.")
+
+        audio_path_str = os.path.abspath(audio_path).replace("\\", "/")
+
+        # Decode once and hand the waveform to the model so it never re-reads the file.
+        # load_audio_fast stats the file once, which also serves as the existence check.
+        audio = load_audio_fast(audio_path_str)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Audio loaded successfully, shape: {audio.shape}")
+        # Run VAD once here: silent files skip the model entirely, and the speech
+        # chunks are handed to the pipeline so it does not run VAD a second time.
+        speech_chunks = detect_speech_chunks(audio)
+        if not speech_chunks:
+            logger.info(f"No speech detected in {audio_path_str}")
+            return
+        if language is None:
+            language = self._resolve_language(audio, speech_chunks)
+
+        # A transcriber shared by concurrent callers (num_workers > 1, e.g. in
+        # WhisperTranscriberPool) stays in-process: each caller spawning a process
+        # pool sized to every core would oversubscribe the CPU.
+        if (self.device == "cpu" and self.num_workers == 1 and _cpu_worker_count() > 1
+                and len(audio) >= settings.WHISPER_CPU_PARALLEL_MIN_SECONDS * SAMPLE_RATE):
+            yield from self._transcribe_parallel_cpu(audio, speech_chunks, language)
+            return
+
+        logger.debug("Starting transcription...")
+        segments, info = self.model.transcribe(
+            audio,
+            language=language,
+            beam_size=5,
+            vad_filter=True,
+            clip_timestamps=speech_chunks,
+            batch_size=self.batch_size,
+        )
+        # segments is a lazy generator; each iteration decodes the next batch
+        for segment in segments:
+            yield {"text": segment.text, "start": segment.start, "end": segment.end}
+        logger.debug(f"Transcription completed successfully (language: {info.language}).")
+
+    def _transcribe_parallel_cpu(self, audio: np.ndarray, speech_chunks: List[Dict[str, Any]],
+                                 language: str) -> Iterator[Dict[str, Any]]:
+        """
+        Transcribe long audio on CPU by spreading spans of it across worker processes.
+
+        A single int8 CTranslate2 model cannot keep every core busy, so the speech
+        chunks are split into spans of similar duration (at most 30 minutes each),
+        and each worker process transcribes one span with its own model and a fixed
+        number of threads. Segments are yielded in order with timestamps relative
+        to the full audio.
+        """
+        cpu_threads = settings.WHISPER_CPU_THREADS_PER_WORKER
+        max_workers = _cpu_worker_count()
+        span_samples = speech_chunks[-1]["end"] - speech_chunks[0]["start"]
+        num_groups = max(max_workers, -(-span_samples // (MAX_CPU_SPAN_SECONDS * SAMPLE_RATE)))
+        groups = _split_speech_chunks(speech_chunks, num_groups)
+        logger.info(f"Transcribing {len(groups)} audio spans across {max_workers} CPU workers")
+
+        # spawn, not fork: the parent has CTranslate2/OpenMP threads running already
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = []
+            for group in groups:
+                span_start, span_end = group[0]["start"], group[-1]["end"]
+                clip_timestamps = [
+                    {"start": chunk["start"] - span_start, "end": chunk["end"] - span_start}
+                    for chunk in group
+                ]
+                futures.append(executor.submit(
+                    _transcribe_span, self.model_name, self.compute_type, cpu_threads,
+                    audio[span_start:span_end], clip_timestamps, language, self.batch_size,
+                    span_start / SAMPLE_RATE,
+                ))
+            for future in futures:
+                yield from future.result()
+        logger.debug("Transcription completed successfully.")
+
+    def _resolve_language(self, audio: np.ndarray, speech_chunks: List[Dict[str, Any]]) -> str:
+        """
+        Pick the transcription language when the caller did not give one.
+
+        English-only models always transcribe English. Otherwise detection runs
+        once on the first 30s of detected speech and the result is passed to the
+        full transcription, so the language-id pass is not repeated per window.
+        """
+        # self.model is the batched pipeline; .model is the faster-whisper WhisperModel
+        # and its .model the CTranslate2 model that knows whether it is multilingual
+        if not self.model.model.model.is_multilingual:
+            return "en"
+        if not settings.AUTO_DETECT_LANGUAGE:
+            return settings.DEFAULT_TRANSCRIPTION_LANGUAGE
+
+        # Gather speech up to one 30s Whisper window; the first chunk alone can be
+        # a fraction of a second, too short for a reliable detection
+        window = LANGUAGE_DETECTION_SECONDS * SAMPLE_RATE
+        speech, collected = [], 0
+        for chunk in speech_chunks:
+            speech.append(audio[chunk["start"]:min(chunk["end"], chunk["start"] + window - collected)])
+            collected += len(speech[-1])
+            if collected >= window:
+                break
+        language, probability, _ = self.model.model.detect_language(np.concatenate(speech))
+        logger.info(f"Detected language '{language}' (probability {probability:.2f})")
+        return language
+
     def transcribe(self, audio_path: str, language: str = None) -> str:
         if not self.model:
             logger.error("Whisper model is not loaded. Cannot transcribe.")
             return "Error: Transcription model not loaded."
 
-        temp_path = None
         try:
-            # Convert to Path object and resolve it
-            audio_file = Path(audio_path).resolve()
-            
-            logger.debug("=== Whisper Audio File Debug Info ===")
-            logger.debug(f"Input path: {audio_path}")
-            logger.debug(f"Resolved path: {audio_file}")
-            logger.debug(f"File exists: {audio_file.exists()}")
-            
-            if not audio_file.exists():
-                raise FileNotFoundError(f"Audio file not found: {audio_file}")
-
-            # Convert to string with forward slashes only when passing to whisper
-            audio_path_str = str(audio_file).replace("\\", "/")
-            logger.debug(f"Normalized path: {audio_path_str}")
-            
-            options = {}
-            if language:
-                options["language"] = language
-
-            audio = whisper.audio.load_audio(audio_path_str)
-            logger.debug(f"Audio loaded successfully, shape: {audio.shape}")
-            logger.debug("Starting transcription...")
-            result = self.model.transcribe(audio_path_str, **options)
-            if result is None:
-                raise RuntimeError("Transcription failed - no result returned")
-            logger.debug("Transcription completed successfully.")
-            return result["text"]
+            return " ".join(
+                segment["text"].strip()
+                for segment in self.transcribe_stream(audio_path, language=language)
+            )
 
         except Exception as e:
             logger.error(f"Error during transcription of {audio_path}: {str(e)}")
             logger.error(f"Exception type: {type(e)}")
             logger.error("Exception details:", exc_info=True)
-            return f"Error during transcription: {e}"
\ No newline at end of file
+            return f"Error during transcription: {e}"
+
+class WhisperTranscriberPool:
+    """
+    Serve concurrent transcription requests from a single shared Whisper model.
+
+    Rather than loading one model per worker, the pool loads the model once with
+    `size` CTranslate2 workers. CTranslate2 releases the GIL while decoding, so up
+    to `size` threads transcribe in parallel; further callers wait for a free slot.
+    """
+
+    def __init__(self, model_path: str = "base", size: int = settings.WHISPER_POOL_SIZE):
+        self.size = size
+        self.transcriber = WhisperTranscriber(model_path=model_path, num_workers=size)
+        self._slots = threading.BoundedSemaphore(size)
+
+    def acquire(self) -> WhisperTranscriber:
+        """Block until a slot is free and return the shared transcriber."""
+        self._slots.acquire()
+        return self.transcriber
+
+    def release(self) -> None:
+        """Return a slot taken with acquire()."""
+        self._slots.release()
+
+    def transcribe(self, audio_path: str, language: str = None) -> str:
+        transcriber = self.acquire()
+        try:
+            return transcriber.transcribe(audio_path, language=language)
+        finally:
+            self.release()
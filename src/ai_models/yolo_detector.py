@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -9,6 +10,12 @@ from ultralytics import YOLO
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=4)
+def get_yolo_model(model_path: str) -> YOLO:
+    """Load a YOLO model once per model path and keep it resident for reuse."""
+    logger.info(f"Loading YOLO model: {model_path}")
+    return YOLO(model_path)
+
 class YOLODetector:
     def __init__(self, model_path: str = "yolov8n.pt"):
         """
@@ -24,8 +31,7 @@ class YOLODetector:
     def _load_model(self):
         """Load the YOLO model"""
         try:
-            logger.info(f"Loading YOLO model: {self.model_path}")
-            self.model = YOLO(self.model_path)
+            self.model = get_yolo_model(self.model_path)
             logger.info("YOLO model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load YOLO model: {e}")
@@ -61,7 +67,12 @@ class YOLODetector:
             return []
 
     def cleanup(self):
-        """Clean up resources"""
+        """
+        Clean up resources
+
+        Only this detector's reference is dropped: the weights stay in the shared
+        get_yolo_model cache on purpose, so later detectors reuse them.
+        """
         if hasattr(self, 'model'):
             del self.model
         if torch.cuda.is_available():
@@ -2,6 +2,33 @@ import os
 import logging
 import yaml
 from pathlib import Path
+from typing import Final, Optional
+
+__all__ = [
+    "SummarizerPrompt",
+    "BASE_DIR",
+    "YOLO_MODEL_PATH",
+    "BLIP_MODEL_PATH",
+    "WHISPER_MODEL_PATH",
+    "PANNS_MODEL_PATH",
+    "MODEL_CACHE_DIR",
+    "DISTIL_WHISPER_MODEL",
+    "USE_DISTIL_WHISPER",
+    "TRANSCRIPTION_MODEL",
+    "WHISPER_BATCH_SIZE",
+    "WHISPER_COMPUTE_TYPE",
+    "WHISPER_FLASH_ATTENTION",
+    "WHISPER_POOL_SIZE",
+    "WHISPER_CPU_PARALLEL_MIN_SECONDS",
+    "WHISPER_CPU_THREADS_PER_WORKER",
+    "OLLAMA_HOST",
+    "DEFAULT_OLLAMA_MODEL",
+    "DEFAULT_TRANSCRIPTION_LANGUAGE",
+    "AUTO_DETECT_LANGUAGE",
+    "VIDEO_FRAME_EXTRACTION_INTERVAL",
+    "summarizer_prompt",
+    "video_summary_prompt",
+]
 
 logger = logging.getLogger(__name__)
 
@@ -47,32 +74,64 @@ class SummarizerPrompt:
 
 
 # Base directory of the project
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BASE_DIR: Final[str] = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # --- Model Paths ---
 # These should point to where your downloaded models are stored,
 # relative to the project or absolute paths.
 # Example: os.path.join(BASE_DIR, "models", "yolov8n.pt")
-YOLO_MODEL_PATH = os.getenv("YOLO_MODEL_PATH", "yolov8n.pt")  # Default, or get from env
-BLIP_MODEL_PATH = os.getenv("BLIP_MODEL_PATH", "path/to/your/blip/model")
-WHISPER_MODEL_PATH = os.getenv(
-    "WHISPER_MODEL_TYPE", "medium"
-)  # e.g., "base", "small", "medium"
-PANNS_MODEL_PATH = os.getenv(
+YOLO_MODEL_PATH: Final[str] = os.getenv("YOLO_MODEL_PATH", "yolo11x.pt")
+BLIP_MODEL_PATH: Final[str] = os.getenv("BLIP_MODEL_PATH", "path/to/your/blip/model")
+# e.g., "base", "small", "medium". WHISPER_MODEL_TYPE is still read for older setups.
+WHISPER_MODEL_PATH: Final[str] = os.getenv(
+    "WHISPER_MODEL", os.getenv("WHISPER_MODEL_TYPE", "medium")
+)
+PANNS_MODEL_PATH: Final[str] = os.getenv(
     "PANNS_MODEL_PATH", os.path.join(BASE_DIR, "models", "cnn14.pth")
 )
+# Hugging Face cache for downloaded weights (e.g. faster-whisper models). Exported
+# as HF_HOME here, before faster-whisper is imported, so a persistent volume
+# mounted at this path lets later runs skip the download.
+MODEL_CACHE_DIR: Final[str] = os.getenv("HF_HOME", os.path.join(BASE_DIR, "models", "hf"))
+os.environ["HF_HOME"] = MODEL_CACHE_DIR
+
+# --- Whisper Settings ---
+# Distilled Whisper for latency-critical runs: distil-large-v2 transcribes about
+# 40% faster than large-v2 at similar WER, but it is English-only. faster-whisper
+# resolves "distil-large-v2" to Systran/faster-distil-whisper-large-v2.
+# Set USE_DISTIL_WHISPER=1 to use it instead of WHISPER_MODEL_PATH.
+DISTIL_WHISPER_MODEL: Final[str] = os.getenv("DISTIL_WHISPER_MODEL", "distil-large-v2")
+USE_DISTIL_WHISPER: Final[bool] = os.getenv("USE_DISTIL_WHISPER", "0") == "1"
+# The Whisper model transcription actually uses
+TRANSCRIPTION_MODEL: Final[str] = DISTIL_WHISPER_MODEL if USE_DISTIL_WHISPER else WHISPER_MODEL_PATH
+# Number of audio chunks decoded together by the batched Whisper pipeline.
+# Lower it (e.g. 8) on GPUs with little VRAM, raise it (e.g. 24) on large cards.
+WHISPER_BATCH_SIZE: Final[int] = int(os.getenv("WHISPER_BATCH_SIZE", "16"))
+# CTranslate2 compute type override (e.g. "float16", "int8_float16", "int8").
+# Leave unset to pick automatically: int8_float16 on Volta+ GPUs, float16 on
+# older GPUs and int8 on CPU.
+WHISPER_COMPUTE_TYPE: Final[Optional[str]] = os.getenv("WHISPER_COMPUTE_TYPE")
+# Set WHISPER_FLASH_ATTENTION=1 to use CTranslate2's flash attention on Ampere+
+# GPUs. Only enable it with a ctranslate2 build that includes flash attention
+# (the standard PyPI wheels may not), otherwise loading the model fails.
+WHISPER_FLASH_ATTENTION: Final[bool] = os.getenv("WHISPER_FLASH_ATTENTION", "0") == "1"
+# Number of transcriptions WhisperTranscriberPool runs concurrently on one model.
+WHISPER_POOL_SIZE: Final[int] = int(os.getenv("WHISPER_POOL_SIZE", "2"))
+# On CPU, audio at least this long (seconds) is split across worker processes,
+# each running its own model with WHISPER_CPU_THREADS_PER_WORKER threads.
+WHISPER_CPU_PARALLEL_MIN_SECONDS: Final[int] = int(os.getenv("WHISPER_CPU_PARALLEL_MIN_SECONDS", "600"))
+WHISPER_CPU_THREADS_PER_WORKER: Final[int] = int(os.getenv("WHISPER_CPU_THREADS_PER_WORKER", "4"))
 
 # --- Ollama Settings ---
-OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
-DEFAULT_OLLAMA_MODEL = os.getenv("DEFAULT_OLLAMA_MODEL", "gemma3")
+OLLAMA_HOST: Final[str] = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+DEFAULT_OLLAMA_MODEL: Final[str] = os.getenv("DEFAULT_OLLAMA_MODEL", "gemma3")
 
 # --- Other Settings ---
-DEFAULT_TRANSCRIPTION_LANGUAGE = "en"
-VIDEO_FRAME_EXTRACTION_INTERVAL = 5  # seconds
-
-# YOLO settings
-YOLO_MODEL_PATH = "yolo11x.pt"  # Use small model by default
-FRAME_INTERVAL_SECONDS = 5  # Extract frame every 5 seconds
+DEFAULT_TRANSCRIPTION_LANGUAGE: Final[str] = "en"  # Used when no language is given
+# Set AUTO_DETECT_LANGUAGE=1 to detect the language (once per file) instead of
+# falling back to DEFAULT_TRANSCRIPTION_LANGUAGE.
+AUTO_DETECT_LANGUAGE: Final[bool] = os.getenv("AUTO_DETECT_LANGUAGE", "0") == "1"
+VIDEO_FRAME_EXTRACTION_INTERVAL: Final[int] = 5  # Extract a frame every 5 seconds
 
 # Video summary settings for LLM
 
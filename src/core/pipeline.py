@@ -1,5 +1,6 @@
 # src/core/pipeline.py
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from ai_models.yolo_detector import YOLODetector
@@ -35,7 +36,11 @@ class VideoAnalysisPipeline:
 
         # Initialize models (consider lazy loading or explicit setup method)
         if self.perform_transcription:
-            self.transcriber = WhisperTranscriber(model_path=settings.WHISPER_MODEL_PATH)
+            # No language means English for English-only models, so only warn on an explicit other language
+            if settings.USE_DISTIL_WHISPER and transcription_language not in (None, "en"):
+                logger.warning(f"Distilled Whisper model '{settings.TRANSCRIPTION_MODEL}' only supports English, "
+                               f"but transcription language is '{transcription_language}'")
+            self.transcriber = WhisperTranscriber(model_path=settings.TRANSCRIPTION_MODEL)
         if self.perform_object_detection:
             self.object_detector = YOLODetector(model_path=settings.YOLO_MODEL_PATH)
         # if self.perform_scene_description:
@@ -55,10 +60,21 @@ class VideoAnalysisPipeline:
             return results
 
         # 2. Speech Transcription (Whisper)
+        # Transcription only needs the audio, so on GPU it runs in the background
+        # while frames are extracted and analysed below. On CPU both stages would
+        # compete for the same cores, so it stays serial.
+        transcription_executor = None
+        transcription_future = None
         if self.perform_transcription and hasattr(self, 'transcriber'):
             logger.info("Transcribing speech...")
-            results["transcription"] = self.transcriber.transcribe(audio_path, language=self.transcription_language)
-            logger.debug(f"Transcription (partial): {results['transcription'][:100]}...")
+            if self.transcriber.device == "cuda":
+                transcription_executor = ThreadPoolExecutor(max_workers=1)
+                transcription_future = transcription_executor.submit(
+                    self.transcriber.transcribe, audio_path, language=self.transcription_language
+                )
+            else:
+                results["transcription"] = self.transcriber.transcribe(audio_path, language=self.transcription_language)
+                logger.debug(f"Transcription (partial): {results['transcription'][:100]}...")
 
     #     # 3. Audio Event Detection (PANNs)
     #     if self.perform_audio_events and hasattr(self, 'audio_event_detector'):
@@ -67,32 +83,43 @@ class VideoAnalysisPipeline:
     #         results["audio_events"] = self.audio_event_detector.detect_events(audio_path)
     #         logger.debug(f"Audio Events: {results['audio_events']}")
 
-        # 4. Frame Extraction (for YOLO & BLIP)
-    #     # This needs careful implementation: select keyframes or process at intervals
-    #     raise NotImplementedError("This is not yet implemented.")
-        logger.info("Extracting frames for visual analysis...")
-        frames_for_analysis = extract_frames_for_analysis(self.video_path, interval_seconds=5)
-
-        # 5. Object Detection (YOLO)
-        if self.perform_object_detection and hasattr(self, 'object_detector') and frames_for_analysis:
-            logger.info("Detecting objects in frames...")
-            all_objects = []
-            for frame in frames_for_analysis:
-                objects = self.object_detector.detect(frame.image)
-                if objects:
-                    all_objects.append({
-                        "timestamp": frame.timestamp,
-                        "objects": objects
-                    })
+        try:
+            # 4. Frame Extraction (for YOLO & BLIP)
+            logger.info("Extracting frames for visual analysis...")
+            frames_for_analysis = extract_frames_for_analysis(self.video_path)
+
+            # 5. Object Detection (YOLO)
+            if self.perform_object_detection and hasattr(self, 'object_detector') and frames_for_analysis:
+                logger.info("Detecting objects in frames...")
+                all_objects = []
+                # Statistics are gathered while detecting, so the results are walked only once
+                total_objects = 0
+                unique_names = set()
+                for frame in frames_for_analysis:
+                    objects = self.object_detector.detect(frame.image)
+                    if objects:
+                        all_objects.append({
+                            "timestamp": frame.timestamp,
+                            "objects": objects
+                        })
+                        total_objects += len(objects)
+                        unique_names.update(obj["class_name"] for obj in objects)
             
-            # Calculate statistics across all frames
-            if all_objects:
-                results["object_detections"] = all_objects
-                total_objects = sum(len(frame["objects"]) for frame in all_objects)
-                unique_objects = len({obj["class_name"] for frame in all_objects for obj in frame["objects"]})
-                logger.info(f"Object Detection: Found {total_objects} instances of {unique_objects} unique object types")
-            else:
-                logger.debug("Object Detection: No objects detected")
+                if all_objects:
+                    results["object_detections"] = all_objects
+                    unique_objects = len(unique_names)
+                    logger.info(f"Object Detection: Found {total_objects} instances of {unique_objects} unique object types")
+                else:
+                    logger.debug("Object Detection: No objects detected")
+
+            if transcription_future is not None:
+                results["transcription"] = transcription_future.result()
+                logger.debug(f"Transcription (partial): {results['transcription'][:100]}...")
+        finally:
+            # Also runs when frame extraction or detection raises, so the background
+            # transcription is always waited for and its thread released
+            if transcription_executor is not None:
+                transcription_executor.shutdown()
 
     #     # 6. Scene Description (BLIP)
     #     if self.perform_scene_description and hasattr(self, 'captioner') and frames_for_analysis:
@@ -179,11 +206,7 @@ class VideoAnalysisPipeline:
             all_detected_objects = {}
             for detection in analysis_results["object_detections"]:
                 for obj in detection["objects"]:
-                    name = obj["class_name"]
-                    conf = obj["confidence"]
-                    if name not in all_detected_objects:
-                        all_detected_objects[name] = []
-                    all_detected_objects[name].append(conf)
+                    all_detected_objects.setdefault(obj["class_name"], []).append(obj["confidence"])
             
             # Sort by frequency and get top 5
             top_objects = sorted(
@@ -0,0 +1,63 @@
+import logging
+import os
+from functools import lru_cache
+
+# External Libraries
+import numpy as np
+import soundfile as sf
+import soxr
+
+logger = logging.getLogger(__name__)
+
+# Sample rate Whisper models expect
+SAMPLE_RATE = 16000
+
+# Formats libsndfile decodes in-process without going through PyAV
+SOUNDFILE_EXTENSIONS = {".wav", ".flac"}
+
+def load_audio_fast(path: str, sr: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Load an audio file as a mono float32 waveform at the given sample rate.
+
+    WAV/FLAC files are read with soundfile and resampled with soxr; other formats
+    are decoded with PyAV. Both run in-process, so no ffmpeg subprocess is spawned.
+    Results are cached per (path, mtime), so retries on the same file reuse the
+    waveform while a rewritten file is decoded again. Up to 8 full-length
+    waveforms stay in memory for the life of the process (about 230 MB per hour
+    of audio), which matters for long-running callers such as
+    WhisperTranscriberPool. The returned array is shared between callers and is
+    therefore read-only; copy it before modifying it.
+
+    Args:
+        path (str): Path to the audio file
+        sr (int): Target sample rate. Defaults to 16 kHz.
+
+    Returns:
+        np.ndarray: Mono float32 waveform
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Audio file not found: {path}") from None
+    return _load_audio_cached(path, mtime, sr)
+
+@lru_cache(maxsize=8)
+def _load_audio_cached(path: str, mtime: int, sr: int) -> np.ndarray:
+    if os.path.splitext(path)[1].lower() in SOUNDFILE_EXTENSIONS:
+        audio, orig_sr = sf.read(path, dtype="float32", always_2d=True)
+        audio = audio.mean(axis=1)
+        if orig_sr != sr:
+            audio = soxr.resample(audio, orig_sr, sr)
+    else:
+        from faster_whisper import decode_audio
+
+        audio = decode_audio(path, sampling_rate=sr)
+
+    logger.debug(f"Loaded audio {path}: {len(audio) / sr:.1f}s at {sr} Hz")
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    # Every caller gets this same cached array, so an in-place change would corrupt later retries
+    audio.setflags(write=False)
+    return audio
@@ -0,0 +1,46 @@
+import logging
+from typing import Optional, Tuple
+
+# External Libraries
+import torch
+
+logger = logging.getLogger(__name__)
+
+def pick_compute_type(device: str) -> str:
+    """
+    Pick the CTranslate2 compute type that best fits the given device.
+
+    INT8 weights are used everywhere int8 matmuls are fast (CPU and Volta+ GPUs),
+    with float16 activations on GPU. CTranslate2 manages precision internally
+    from there, so no autocast is applied on top.
+
+    Args:
+        device (str): "cuda" or "cpu"
+
+    Returns:
+        str: CTranslate2 compute type, e.g. "int8_float16"
+    """
+    if device != "cuda":
+        return "int8"
+
+    major, _ = torch.cuda.get_device_capability()
+    if major >= 7:
+        # Volta/Turing/Ampere+: INT8 weights with FP16 activations run on the int8 GEMM path
+        return "int8_float16"
+    # Pascal and older have no fast int8 matmul
+    return "float16"
+
+def get_device_settings(compute_type_override: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Pick the device and CTranslate2 compute type for model inference.
+
+    Args:
+        compute_type_override (str, optional): Compute type to use instead of the automatic choice
+
+    Returns:
+        Tuple[str, str]: (device, compute_type), e.g. ("cuda", "int8_float16")
+    """
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    compute_type = compute_type_override or pick_compute_type(device)
+    logger.debug(f"Device settings: device={device}, compute_type={compute_type}")
+    return device, compute_type
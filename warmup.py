@@ -0,0 +1,26 @@
+import logging
+from src.utils.logging_setup import setup_logging
+from src.config import settings
+
+def main():
+    """Download and load every model the analyzer uses so later runs start warm."""
+    setup_logging()
+    logger = logging.getLogger(__name__)
+    logger.info(f"Warming up models (cache: {settings.MODEL_CACHE_DIR})")
+
+    # Imported here so the model libraries load after settings has set HF_HOME
+    import numpy as np
+    from src.ai_models.whisper_transcriber import WhisperTranscriber, detect_speech_chunks
+    from src.ai_models.yolo_detector import get_yolo_model
+    from src.utils.audio_io import SAMPLE_RATE
+
+    # Loads the Whisper weights and runs a second of silence through them
+    WhisperTranscriber.preload(settings.TRANSCRIPTION_MODEL)
+    # The VAD model is loaded lazily on first use
+    detect_speech_chunks(np.zeros(SAMPLE_RATE, dtype=np.float32))
+    get_yolo_model(settings.YOLO_MODEL_PATH)
+
+    logger.info("Warm-up completed successfully.")
+
+if __name__ == "__main__":
+    main()